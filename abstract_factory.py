@@ -59,27 +59,36 @@ Not important:
 * unit tests: it’s about the class structure
 * implementations of the various concrete query runners
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Union
+import functools
+import importlib
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple, Type, Union
 
 
-# Abstract base classes for query runner and factory
-class QueryRunner(ABC):
+# Base classes documenting the query runner and factory interfaces. They
+# are plain classes rather than abc.ABC, so creating and instantiating
+# subclasses skips ABCMeta's abstract-method scan
+class QueryRunner:
+    __slots__ = ()
 
-    @abstractmethod
     def get_number(self, configuration: Dict) -> Union[int, float]:
-        pass
+        raise NotImplementedError
 
 
-class AbstractQueryRunnerFactory(ABC):
+class AbstractQueryRunnerFactory:
 
-    @abstractmethod
     def get_query_runner(self, name: str) -> QueryRunner:
-        pass
+        raise NotImplementedError
 
 
 # Concrete query runner classes for different database implementations
 class MongoDBQueryRunner(QueryRunner):
+    __slots__ = ()
 
     def get_number(self, configuration: Dict) -> int:
         # Actual implementation code to query MongoDB
@@ -87,6 +96,7 @@ class MongoDBQueryRunner(QueryRunner):
 
 
 class MySQLQueryRunner(QueryRunner):
+    __slots__ = ()
 
     def get_number(self, configuration: Dict) -> int:
         # Actual implementation code to query MySQL
@@ -94,27 +104,282 @@ class MySQLQueryRunner(QueryRunner):
 
 
 class BigQueryQueryRunner(QueryRunner):
+    __slots__ = ()
 
     def get_number(self, configuration: Dict) -> int:
         # Actual implementation code to query BigQuery
         return 3
 
 
+# A frozen manifest of external runners ("name" -> "module:Class") lets
+# read-only deployments skip scanning installed distributions at runtime
+MANIFEST_ENV_VAR = "QUERY_RUNNERS_MANIFEST"
+DEFAULT_MANIFEST = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "query_runners.json")
+
+
+def _is_runner_class(runner_class) -> bool:
+    # Duck-typed on purpose: anything with a callable get_number will do,
+    # QueryRunner only documents the interface
+    return (isinstance(runner_class, type)
+            and callable(getattr(runner_class, "get_number", None)))
+
+
+def _resolve_runner(target: str) -> Optional[Type[QueryRunner]]:
+    # Import errors propagate: a broken plugin is a deployment problem
+    module_name, _, attr = target.partition(":")
+    runner_class = importlib.import_module(module_name)
+    # A target without an attribute names a module, never a runner class
+    for part in attr.split(".") if attr else ():
+        runner_class = getattr(runner_class, part)
+    return runner_class if _is_runner_class(runner_class) else None
+
+
+def _entry_point_target(value: str) -> str:
+    # Drops any "[extras]" suffix and the whitespace the entry point syntax
+    # allows; EntryPoint.module/.attr would do this but need Python 3.9+
+    module_name, _, attr = value.split("[", 1)[0].partition(":")
+    module_name, attr = module_name.strip(), attr.strip()
+    return f"{module_name}:{attr}" if attr else module_name
+
+
+def _scan_entry_points() -> Dict[str, str]:
+    # Imported here: importlib.metadata costs more than the rest of this
+    # module, and only discovery without a manifest needs it
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        from importlib_metadata import entry_points
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        group = eps.select(group="query_runners")
+    else:  # Python < 3.10 returns a dict of groups
+        group = eps.get("query_runners", [])
+    return {ep.name: _entry_point_target(ep.value) for ep in group}
+
+
+def _load_frozen_manifest(path: str) -> Dict[str, str]:
+    import json
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"Invalid query runner manifest: {path}.") from exc
+    if not isinstance(manifest, dict) or not all(
+            isinstance(name, str) and isinstance(target, str)
+            for name, target in manifest.items()):
+        raise ValueError(
+            f"Invalid query runner manifest: {path}; expected an object "
+            f"mapping runner names to \"module:Class\" strings.")
+    return manifest
+
+
+def _manifest_path() -> str:
+    return os.environ.get(MANIFEST_ENV_VAR) or DEFAULT_MANIFEST
+
+
+def freeze(path: Optional[str] = None) -> Dict[str, str]:
+    import json
+    path = path or _manifest_path()
+    manifest = _scan_entry_points()
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_external_runners() -> Dict[str, str]:
+    # Implementations shipped in separate libraries register themselves
+    # under the "query_runners" entry point group. The scan is done once
+    # per process; QueryRunnerFactory.reload_external_runners() forces
+    # rediscovery after installing a new implementation. Only the
+    # "module:Class" targets are recorded, so a runner's module (and its
+    # database driver) is imported the first time it is requested.
+    # A manifest named in the environment is required; the default one is
+    # only used when present
+    manifest = _manifest_path()
+    if os.environ.get(MANIFEST_ENV_VAR) or os.path.exists(manifest):
+        runners = _load_frozen_manifest(manifest)
+    else:
+        runners = _scan_entry_points()
+    # Interned keys let lookups with interned names hit the identity fast path
+    return {sys.intern(name): target for name, target in runners.items()}
+
+
 # Concrete factory class for creating database-specific query runners
 class QueryRunnerFactory(AbstractQueryRunnerFactory):
 
-    def get_query_runner(self, name: str) -> QueryRunner:
-        if name == "mongodb":
-            return MongoDBQueryRunner()
-        elif name == "mysql":
-            return MySQLQueryRunner()
-        elif name == "bigquery":
-            return BigQueryQueryRunner()
+    # Built-in runners; treat as read-only and use register_runner instead
+    _RUNNERS: Dict[str, Type[QueryRunner]] = {
+        "mongodb": MongoDBQueryRunner,
+        "mysql": MySQLQueryRunner,
+        "bigquery": BigQueryQueryRunner,
+    }
+    # A runner whose module failed to import is rejected for this long
+    # before the import is retried
+    _LOAD_RETRY_SECONDS = 30.0
+
+    def __init__(self):
+        # Per-instance registry; registering a runner on one factory never
+        # leaks into another
+        self._runners: Dict[str, Union[str, Type[QueryRunner]]] = dict(
+            self._RUNNERS)
+        # Kept apart so rediscovery can rebuild the registry around them
+        self._registered: Dict[str, Type[QueryRunner]] = {}
+        # Runners are stateless, so one instance per name is reused
+        self._instances: Dict[str, QueryRunner] = {}
+        # Monomorphic inline cache: dashboards tend to ask for the same
+        # runner over and over, so remember the last hit
+        self._last_name: Optional[str] = None
+        self._last_runner: Optional[QueryRunner] = None
+        # Recently rejected names, so a misconfigured dashboard asking for
+        # the same bad name over and over fails fast. Maps each name to the
+        # error message, its cause and when the rejection expires
+        self._negative: Deque[str] = deque(maxlen=64)
+        self._negative_errors: Dict[
+            str, Tuple[str, Optional[BaseException], float]] = {}
+        # Entry point discovery is deferred until an unknown name is requested
+        self._external_loaded = False
+        self._external_lock = threading.Lock()
+
+    def _load_external_runners(self):
+        # Built-in and explicitly registered runners take precedence over
+        # discovered ones
+        self._runners = {**_discover_external_runners(), **self._RUNNERS,
+                         **self._registered}
+        self._clear_negative()
+
+    def _ensure_external_runners(self):
+        if self._external_loaded:
+            return
+        with self._external_lock:
+            if not self._external_loaded:
+                try:
+                    self._load_external_runners()
+                finally:
+                    # A broken manifest is reported once rather than
+                    # re-read on every unknown name
+                    self._external_loaded = True
+
+    def reload_external_runners(self):
+        with self._external_lock:
+            _discover_external_runners.cache_clear()
+            try:
+                self._load_external_runners()
+            finally:
+                self._external_loaded = True
+                self.invalidate()
+
+    def register_runner(self, name: str, runner_class: Type[QueryRunner]):
+        # Validated during development only; stripped under python -O
+        if __debug__ and not _is_runner_class(runner_class):
+            raise TypeError(f"{runner_class!r} is not a QueryRunner.")
+        name = sys.intern(name)
+        self._registered[name] = runner_class
+        self._runners[name] = runner_class
+        self._clear_negative()
+        self.invalidate(name)
+
+    def invalidate(self, name: Optional[str] = None):
+        self._last_name = self._last_runner = None
+        if name is None:
+            self._instances.clear()
         else:
-            raise ValueError(f"Invalid query runner name: {name}.")
+            self._instances.pop(name, None)
+
+    def _clear_negative(self):
+        self._negative.clear()
+        self._negative_errors.clear()
+
+    def _remember_negative(self, name: str, message: str,
+                           cause: Optional[BaseException] = None,
+                           retry_after: float = math.inf):
+        if name not in self._negative_errors:
+            if len(self._negative) == self._negative.maxlen:
+                self._negative_errors.pop(self._negative[0], None)
+            self._negative.append(name)
+        self._negative_errors[name] = (
+            message, cause, time.monotonic() + retry_after)
+
+    def _get_runner_class(self, name: str) -> Type[QueryRunner]:
+        rejected = self._negative_errors.get(name)
+        if rejected is not None and time.monotonic() < rejected[2]:
+            raise ValueError(rejected[0]) from rejected[1]
+        runner_class = self._runners.get(name)
+        if runner_class is None and not self._external_loaded:
+            try:
+                self._ensure_external_runners()
+            except ValueError as exc:
+                self._remember_negative(name, str(exc), exc.__cause__)
+                raise
+            runner_class = self._runners.get(name)
+        if isinstance(runner_class, str):
+            try:
+                runner_class = _resolve_runner(runner_class)
+            except Exception as exc:
+                # Keep the entry so the import is retried once the
+                # rejection expires
+                message = f"Failed to load query runner: {name}."
+                self._remember_negative(
+                    name, message, exc, self._LOAD_RETRY_SECONDS)
+                raise ValueError(message) from exc
+            if runner_class is None:
+                # Other threads may resolve the same name concurrently
+                self._runners.pop(name, None)
+            else:
+                self._runners[name] = runner_class
+        if runner_class is None:
+            message = f"Invalid query runner name: {name}."
+            self._remember_negative(name, message)
+            raise ValueError(message)
+        return runner_class
+
+    def get_query_runner(self, name: str) -> QueryRunner:
+        # Registry keys are interned; callers reading names from config can
+        # sys.intern() them once so both checks below compare by identity
+        runner = self._last_runner
+        last_name = self._last_name
+        if runner is not None and (name is last_name or name == last_name):
+            return runner
+        runner = self._instances.get(name)
+        if runner is None:
+            runner = self._instances[name] = self._get_runner_class(name)()
+        self._last_name, self._last_runner = name, runner
+        return runner
+
+
+# Shared factory for callers, e.g. web request handlers, that should not
+# build (and warm up) a new factory every time. It lives for the rest of
+# the process; call reload_external_runners() after installing or
+# removing an implementation
+_default: Optional[QueryRunnerFactory] = None
+_default_lock = threading.Lock()
+
+
+def get_factory() -> QueryRunnerFactory:
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = QueryRunnerFactory()
+    return _default
+
+
+def get_query_runner(name: str) -> QueryRunner:
+    return get_factory().get_query_runner(name)
+
+
+def reload_external_runners():
+    get_factory().reload_external_runners()
 
 
 if __name__ == "__main__":
+    # python -m abstract_factory freeze [path]
+    if sys.argv[1:2] == ["freeze"]:
+        path = sys.argv[2] if len(sys.argv) > 2 else _manifest_path()
+        print(f"Froze {len(freeze(path))} query runner(s) into {path}")
+        sys.exit(0)
+
     query_runner_name = "bigquery"
     query_options = {
         "sql_statement": "select count(*) as the_number from `orders`",